@@ -27,35 +27,295 @@ Command line tool for the automatic creation of Minecraft spigot test servers
 """
 
 import sys
-import argparse
-import subprocess
-import platform
-import requests
-import shutil
-import tempfile
-import json
-import concurrent.futures
+import logging
+import dataclasses
+import functools
+import contextlib
+import threading
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import time
 import os
+import re
+import io
+import stat
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj, indent: bool = True) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    import json
+    _loads = json.loads
+
+    def _dumps(obj, indent: bool = True) -> bytes:
+        if not indent:
+            return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+
+# Diagnose-Ausgaben laufen über logging; formatiert wird nur bei aktivem Level
+log = logging.getLogger("spigot_creator")
+
+
+def _configure_logging(level: str = "INFO") -> None:
+    """Sets up the module logger (SPIGOT_DEBUG=1 forces DEBUG)"""
+    if os.environ.get("SPIGOT_DEBUG"):
+        level = "DEBUG"
+    lvl = logging.getLevelName(str(level).upper())
+    log.setLevel(lvl if isinstance(lvl, int) else logging.INFO)
+    if not log.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+        log.addHandler(handler)
+        log.propagate = False
+
+# Hauptversion aus 'java -version' ("1.8.0_392" -> 8, "21.0.2" -> 21)
+_JAVA_VER_RE = re.compile(r'version "(\d+)(?:\.(\d+))?')
+_SUPPORTED_JAVA_MAJORS = frozenset(range(17, 22))
+
+# Aikar's JVM-Flags für die Start-Skripte (einmalig beim Import gebaut)
+_AIKAR_FLAGS = " ".join((
+    "-XX:+UseG1GC",
+    "-XX:+ParallelRefProcEnabled",
+    "-XX:MaxGCPauseMillis=200",
+    "-XX:+UnlockExperimentalVMOptions",
+    "-XX:+DisableExplicitGC",
+    "-XX:+AlwaysPreTouch",
+    "-XX:G1NewSizePercent=30",
+    "-XX:G1MaxNewSizePercent=40",
+    "-XX:G1HeapRegionSize=8M",
+    "-XX:G1ReservePercent=20",
+    "-XX:G1HeapWastePercent=5",
+    "-XX:G1MixedGCCountTarget=4",
+    "-XX:InitiatingHeapOccupancyPercent=15",
+    "-XX:G1MixedGCLiveThresholdPercent=90",
+    "-XX:G1RSetUpdatingPauseTimePercent=5",
+    "-XX:SurvivorRatio=32",
+    "-XX:+PerfDisableSharedMem",
+    "-XX:MaxTenuringThreshold=1",
+    "-Dusing.aikars.flags=https://mcflags.emc.gs",
+    "-Daikars.new.flags=true",
+))
+
+# ioctl-Nummer für Reflink-Kopien (Linux, btrfs/xfs)
+_FICLONE = 0x40049409
+
+# unlinkat/rmdir relativ zu Verzeichnis-Handles verfügbar (Linux/macOS)
+_HAVE_DIR_FD = (
+    os.open in os.supports_dir_fd
+    and os.unlink in os.supports_dir_fd
+    and os.rmdir in os.supports_dir_fd
+    and os.scandir in os.supports_fd
+)
+
+_PROPERTIES_HEADER = "# Minecraft server properties\n# Generated by Spigot Server Creator"
+
+# Bekannte Spigot-Versionen, neueste zuerst
+_SPIGOT_VERSIONS: Tuple[str, ...] = (
+    "1.21.4", "1.21.3", "1.21.2", "1.21.1", "1.21",
+    "1.20.6", "1.20.5", "1.20.4", "1.20.3", "1.20.2", "1.20.1", "1.20",
+    "1.19.4", "1.19.3", "1.19.2", "1.19.1", "1.19",
+    "1.18.2", "1.18.1", "1.18",
+    "1.17.1", "1.17",
+    "1.16.5", "1.16.4", "1.16.3", "1.16.2", "1.16.1",
+    "1.15.2", "1.15.1", "1.15",
+    "1.14.4", "1.14.3", "1.14.2", "1.14.1", "1.14",
+    "1.13.2", "1.13.1", "1.13",
+    "1.12.2", "1.12.1", "1.12",
+    "1.11.2", "1.11.1", "1.11",
+    "1.10.2", "1.10",
+    "1.9.4", "1.9.2", "1.9",
+    "1.8.8"
+)
+
+# Vorlagen der Start-Skripte, nur Speicher und Java-Aufruf werden eingesetzt
+_SH_TEMPLATE = (
+    "#!/bin/bash\n"
+    "# Minecraft Spigot Server Start Script\n"
+    "# Generated by Spigot Server Creator\n\n"
+    "echo 'Starting Minecraft Spigot Server...'\n"
+    "echo 'Memory allocation: {memory}'\n"
+    "echo 'Java command: {java_cmd}'\n"
+    "echo ''\n\n"
+    "{java_cmd}\n"
+    "\necho 'Server stopped.'\n"
+    "read -p 'Press enter to continue...'\n"
+)
+
+_BAT_TEMPLATE = (
+    "@echo off\n"
+    "REM Minecraft Spigot Server Start Script\n"
+    "REM Generated by Spigot Server Creator\n\n"
+    "echo Starting Minecraft Spigot Server...\n"
+    "echo Memory allocation: {memory}\n"
+    "echo Java command: {java_cmd}\n"
+    "echo.\n\n"
+    "{java_cmd}\n"
+    "\necho Server stopped.\n"
+    "pause\n"
+)
+
+# SHA-256 bekannter Spigot-JARs der Mirrors (Version -> Hex-Digest); ohne Eintrag
+# wird nur geprüft, ob die Datei überhaupt ein JAR (ZIP) ist
+_KNOWN_SPIGOT_SHA256: Dict[str, str] = {}
+
+# eula.txt ist für jeden Server gleich: einmal beim Import kodieren
+_EULA_BYTES = (
+    "# EULA Agreement\n"
+    "# By changing the setting below to TRUE you are indicating your agreement to our EULA\n"
+    "# https://account.mojang.com/documents/minecraft_eula\n"
+    "eula=true\n"
+).replace("\n", os.linesep).encode('utf-8')
+
+# Zeitstempel (time.strftime('%Y-%m-%d %H:%M:%S')) in server.properties, README.md und server_info.json
+_STAMP_RE = re.compile(rb"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d")
+
+# Erlaubte Werte für create/batch; Tupel, damit --help die Reihenfolge beibehält
+_SERVER_TYPES = ('spigot', 'bukkit', 'vanilla')
+_GAMEMODES = ('survival', 'creative', 'adventure', 'spectator')
+_DIFFICULTIES = ('peaceful', 'easy', 'normal', 'hard')
+
+
+@dataclasses.dataclass(frozen=True)
+class CreateOptions:
+    """Options for create_server, built once from the command line"""
+    type: str = "spigot"
+    gamemode: str = "creative"
+    difficulty: str = "peaceful"
+    max_players: int = 10
+    online_mode: bool = False
+    pvp: bool = False
+    whitelist: bool = False
+    enforce_whitelist: bool = False
+    motd: str = "Spigot Test Server"
+    view_distance: int = 10
+    simulation_distance: int = 10
+    spawn_protection: int = 0
+    enable_command_block: bool = True
+    spawn_monsters: bool = True
+    spawn_animals: bool = True
+    spawn_npcs: bool = True
+    allow_flight: bool = True
+    force_rebuild: bool = False
+    force_overwrite: bool = False
+
+
+def _jar_name(server_type: str, version: str) -> str:
+    """File name of the server JAR inside the server directory"""
+    if server_type == 'vanilla':
+        return f"minecraft_server.{version}.jar"
+    return f"{server_type}-{version}.jar"
+
+
+def _read_bytes(path, limit: Optional[int] = None) -> bytes:
+    """Reads a small file with os.open/os.read, without the buffered I/O stack of open()"""
+    # os.open setzt O_CLOEXEC bereits selbst (PEP 446)
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if limit is not None:
+            return os.read(fd, limit)
+        # Ein Byte mehr als fstat meldet: eine zwischenzeitlich gewachsene Datei wird erkannt
+        size = os.fstat(fd).st_size + 1
+        data = os.read(fd, size)
+        if len(data) < size:
+            return data
+        chunks = [data]
+        while True:
+            chunk = os.read(fd, 1024 * 1024)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
 
 
 class SpigotServerCreator:
-    def __init__(self, servers_dir: Optional[Path] = None):
+    def __init__(self, servers_dir: Optional[Path] = None, quick_mode: Optional[bool] = None):
         self.base_dir = Path.cwd()
         self.servers_dir = Path(servers_dir) if servers_dir else self.base_dir / "servers"
         self.cache_dir = Path.home() / ".minecraft_server_creator" / "cache"
         self.config_file = Path.home() / ".minecraft_server_creator" / "config.json"
         
         self.servers_dir.mkdir(exist_ok=True)
+        # Legt auch ~/.minecraft_server_creator für config.json an
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
+        # Überschreibt quick_mode nur für diese Instanz, ohne es in config.json zu speichern
+        self._quick_mode = quick_mode
         self.config = self.load_config()
+        _configure_logging(self.config.get("log_level", "INFO"))
+
+        # HTTP-Session wird erst beim ersten Download angelegt (siehe _session)
+        self._http = None
         
-        self._versions_cache = None
-        self._versions_cache_time = 0
+        self._manifest_by_id: Optional[Dict[str, Dict]] = None
+        self._version_json_cache: Dict[str, Dict] = {}
+        self._bukkit_head_cache: Dict[str, int] = {}
+        self._java_ok: Optional[bool] = None
+        # Von update_config(..., flush=False) geänderte, noch nicht geschriebene Konfiguration
+        self._config_dirty = False
     
+    @property
+    def quick_mode(self) -> bool:
+        """quick_mode from the configuration, unless overridden for this instance"""
+        if self._quick_mode is not None:
+            return self._quick_mode
+        return self.config.get("quick_mode", False)
+
+    @property
+    def _session(self):
+        """Shared requests.Session; requests is imported on first use only"""
+        if self._http is None:
+            # list/remove/config brauchen kein HTTP, der Import von requests kostet spürbar Startzeit
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            # Eine Session für alle HTTP-Aufrufe (Keep-Alive, ein TLS-Handshake pro Host)
+            session = requests.Session()
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            })
+            # Kurze Wiederholung bei Verbindungsfehlern und 502/503/504 der Mirrors
+            retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retries)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._http = session
+        return self._http
+
+    def close(self) -> None:
+        """Writes pending config changes and closes the pooled HTTP connections"""
+        self.flush_config()
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    def __enter__(self) -> "SpigotServerCreator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _read_config(path: str, mtime_ns: int, size: int, ino: int) -> Dict:
+        """Parses config.json, memoized per (path, mtime, size, inode) within the process"""
+        return _loads(_read_bytes(path))
+
     def load_config(self) -> Dict:
         """Loads the configuration or creates a standard configuration"""
         default_config = {
@@ -66,202 +326,492 @@ class SpigotServerCreator:
             "use_prebuilt_spigot": True, 
             "parallel_downloads": True,  
             "skip_java_check": False,   
-            "quick_mode": False          
+            "quick_mode": False,
+            "log_level": "INFO"
         }
         
-        if self.config_file.exists():
+        try:
+            st = os.stat(self.config_file)
+        except FileNotFoundError:
+            st = None
+
+        if st is not None:
             try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    
-                    for key, value in default_config.items():
-                        if key not in config:
-                            config[key] = value
-                    return config
+                # Kopie, damit update_config den gecachten Stand nicht verändert
+                # Größe und Inode zusätzlich zur mtime, da deren Auflösung grob sein kann
+                config = dict(self._read_config(os.fspath(self.config_file), st.st_mtime_ns, st.st_size, st.st_ino))
+
+                missing = [key for key in default_config if key not in config]
+                if missing:
+                    for key in missing:
+                        config[key] = default_config[key]
+                    self._write_bytes_atomic(self.config_file, _dumps(config))
+                return config
             except Exception as e:
                 print(f"Warning: Could not load configuration: {e}")
         
-        self.config_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_file, 'w') as f:
-            json.dump(default_config, f, indent=2)
+        self._write_bytes_atomic(self.config_file, _dumps(default_config))
         
         return default_config
     
-    def check_java_version(self) -> bool:
-        """Checks whether Java is available and has a suitable version"""
+    def _java_cache_key(self) -> Optional[List]:
+        """Identifies the Java binary by its resolved path and mtime"""
+        import shutil
+        java = shutil.which(self.config["java_path"])
+        if java is None:
+            return None
+        real = os.path.realpath(java)
+        try:
+            return [real, os.stat(real).st_mtime_ns]
+        except OSError:
+            return None
+
+    def check_java_version(self, refresh: bool = False) -> bool:
+        """Checks whether Java is available and has a suitable version (once per instance);
+        refresh ignores the cached result and runs 'java -version' again"""
+        if self._java_ok is None or refresh:
+            self._java_ok = self._check_java_version(use_cache=not refresh)
+        return self._java_ok
+
+    def _check_java_version(self, use_cache: bool = True) -> bool:
+        """Runs the actual Java detection for check_java_version"""
+        import subprocess
+
         if self.config.get("skip_java_check", False):
             print("Java-Check skiped (skip_java_check=true)")
             return True
-            
-        try:
-            result = subprocess.run(
-                [self.config["java_path"], "-version"],
-                capture_output=True,
-                text=True,
-                timeout=5 
-            )
 
-            output = result.stderr + result.stdout
-            if result.returncode != 0 or "version" not in output.lower():
-                print(f"Error: Java not found under'{self.config['java_path']}'")
-                return False
+        # Unverändertes Java-Binary -> kein erneuter JVM-Start für 'java -version'
+        key = self._java_cache_key()
+        cached = self.config.get("_java_cache")
+        if use_cache and key is not None and isinstance(cached, dict) and cached.get("key") == key:
+            version_line = cached.get("version_line", "")
+        else:
+            try:
+                result = subprocess.run(
+                    [self.config["java_path"], "-version"],
+                    capture_output=True,
+                    text=True,
+                    timeout=5 
+                )
 
-            version_line = output.split('\n')[0]
-            if not self.config.get("quick_mode", False):
-                print(f"Java found: {version_line}")
+                output = result.stderr + result.stdout
+                if result.returncode != 0 or "version" not in output.lower():
+                    print(f"Error: Java not found under'{self.config['java_path']}'")
+                    return False
 
-            if any(f"{v}." in version_line for v in range(17, 22)):
-                return True
-            elif "1.8" in version_line:
-                if not self.config.get("quick_mode", False):
-                    print("Warning: Java 8 detected. Java 17+ is recommended for Minecraft 1.17+.")
-                return True
-            else:
-                if not self.config.get("quick_mode", False):
-                    print("Warning: Unknown Java version. Continue...")
-                return True
+                version_line = output.split('\n')[0]
 
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            print("Error: Java not found or timeout. Please install Java or set skip_java_check=true.")
-            return False
-        except Exception as e:
-            print(f"Error when checking the Java version: {e}")
-            return False
+                if key is not None:
+                    self.config["_java_cache"] = {"key": key, "version_line": version_line}
+                    self._write_bytes_atomic(self.config_file, _dumps(self.config))
+
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                print("Error: Java not found or timeout. Please install Java or set skip_java_check=true.")
+                return False
+            except Exception as e:
+                print(f"Error when checking the Java version: {e}")
+                return False
+
+        if not self.quick_mode:
+            print(f"Java found: {version_line}")
+
+        match = _JAVA_VER_RE.search(version_line)
+        major = None
+        if match:
+            major = int(match.group(2) if match.group(1) == "1" and match.group(2) else match.group(1))
+        if major in _SUPPORTED_JAVA_MAJORS:
+            return True
+        elif major == 8:
+            if not self.quick_mode:
+                print("Warning: Java 8 detected. Java 17+ is recommended for Minecraft 1.17+.")
+            return True
+        else:
+            if not self.quick_mode:
+                print("Warning: Unknown Java version. Continue...")
+            return True
     
     def get_available_versions(self) -> List[str]:
-        """Fetches available spigot versions with caching"""
-        if (self._versions_cache and 
-            time.time() - self._versions_cache_time < 3600):
-            return self._versions_cache
-        
-        try:
-            versions = [
-                "1.21.4", "1.21.3", "1.21.2", "1.21.1", "1.21",
-                "1.20.6", "1.20.5", "1.20.4", "1.20.3", "1.20.2", "1.20.1", "1.20",
-                "1.19.4", "1.19.3", "1.19.2", "1.19.1", "1.19",
-                "1.18.2", "1.18.1", "1.18",
-                "1.17.1", "1.17",
-                "1.16.5", "1.16.4", "1.16.3", "1.16.2", "1.16.1",
-                "1.15.2", "1.15.1", "1.15",
-                "1.14.4", "1.14.3", "1.14.2", "1.14.1", "1.14",
-                "1.13.2", "1.13.1", "1.13",
-                "1.12.2", "1.12.1", "1.12",
-                "1.11.2", "1.11.1", "1.11",
-                "1.10.2", "1.10",
-                "1.9.4", "1.9.2", "1.9",
-                "1.8.8"
-            ]
-            
-            self._versions_cache = versions
-            self._versions_cache_time = time.time()
-            return versions
-        except Exception as e:
-            print(f"Warning: Could not retrieve versions: {e}")
-            return ["1.21.4", "1.20.4", "1.19.4", "1.18.2", "1.17.1", "1.16.5"]
+        """Returns the known Spigot versions (newest first)"""
+        return list(_SPIGOT_VERSIONS)
     
     def should_update_buildtools(self) -> bool:
         """Checks whether BuildTools should be updated"""
         buildtools_path = self.cache_dir / "BuildTools.jar"
         
-        if not buildtools_path.exists():
+        try:
+            st = buildtools_path.stat()
+        except FileNotFoundError:
             return True
 
-        if self.config.get("quick_mode", False):
+        if self.quick_mode:
             update_interval = self.config["buildtools_update_interval"] * 7
         else:
             update_interval = self.config["buildtools_update_interval"]
         
-        file_age = time.time() - buildtools_path.stat().st_mtime
+        file_age = time.time() - st.st_mtime
         return file_age > update_interval
-    
+
+    def _scandir_rmtree(self, path: Path, ignore_errors: bool = False) -> None:
+        """Iterative post-order removal based on os.scandir (no extra stat calls)"""
+        def attempt(func, *args):
+            try:
+                return func(*args)
+            except OSError:
+                if not ignore_errors:
+                    raise
+                return None
+
+        root = os.fspath(path)
+        root_it = attempt(os.scandir, root)
+        stack = [(root, root_it)] if root_it is not None else []
+        try:
+            while stack:
+                current, it = stack[-1]
+                for entry in it:
+                    if entry.is_symlink() or not entry.is_dir(follow_symlinks=False):
+                        attempt(os.unlink, entry.path)
+                    else:
+                        sub_it = attempt(os.scandir, entry.path)
+                        if sub_it is not None:
+                            stack.append((entry.path, sub_it))
+                            break
+                else:
+                    # Iterator erschöpft: Handle schließen, dann Verzeichnis entfernen
+                    it.close()
+                    stack.pop()
+                    attempt(os.rmdir, current)
+        finally:
+            for _, it in stack:
+                it.close()
+
+    def _unlinkat_rmtree(self, path: Path) -> None:
+        """Removes a tree with unlinkat/rmdir relative to directory fds (no path lookup per entry)"""
+        flags = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_NOFOLLOW", 0)
+
+        def open_dir(name, dir_fd=None):
+            fd = os.open(name, flags, dir_fd=dir_fd)
+            try:
+                with os.scandir(fd) as it:
+                    return fd, iter(list(it))
+            except BaseException:
+                os.close(fd)
+                raise
+
+        # Expliziter Stapel statt Rekursion, damit tiefe Bäume keinen RecursionError auslösen;
+        # Einträge: (Verzeichnis-fd, Name im Elternverzeichnis, restliche Einträge)
+        root_fd, root_entries = open_dir(path)
+        stack = [(root_fd, None, root_entries)]
+        try:
+            while stack:
+                dir_fd, name, entries = stack[-1]
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        child_fd, child_entries = open_dir(entry.name, dir_fd)
+                        stack.append((child_fd, entry.name, child_entries))
+                        break
+                    os.unlink(entry.name, dir_fd=dir_fd)
+                else:
+                    # Verzeichnis leer: fd schließen, dann relativ zum Elternverzeichnis entfernen
+                    stack.pop()
+                    os.close(dir_fd)
+                    if stack:
+                        os.rmdir(name, dir_fd=stack[-1][0])
+        finally:
+            for dir_fd, _, _ in stack:
+                os.close(dir_fd)
+        os.rmdir(path)
+
+    def _parallel_rmtree(self, path: Path) -> None:
+        """Removes the top-level subdirectories in parallel, files directly in the main thread"""
+        import concurrent.futures
+        subdirs = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_symlink() or not entry.is_dir(follow_symlinks=False):
+                    os.unlink(entry.path)
+                else:
+                    subdirs.append(entry.path)
+
+        if subdirs:
+            max_workers = min(8, os.cpu_count() or 1, len(subdirs))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Mit dir_fd-Unterstützung (POSIX) relativ zum Verzeichnis-Handle löschen
+                worker = self._unlinkat_rmtree if _HAVE_DIR_FD else self._scandir_rmtree
+                futures = [executor.submit(worker, subdir) for subdir in subdirs]
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
+
+        os.rmdir(path)
+
     def fast_rmtree(self, path: Path, show_progress: bool = False):
         """Fast removal of a directory, especially on Windows - IMPROVED VERSION"""
-        if show_progress and not self.config.get("quick_mode", False):
+        import subprocess
+
+        if show_progress and not self.quick_mode:
             print(f"Removing directory: {path}")
 
         if not path.exists():
-            if show_progress and not self.config.get("quick_mode", False):
+            if show_progress and not self.quick_mode:
                 print("Directory does not exist, nothing to remove")
             return
 
-        if platform.system() == "Windows":
-            try:
-                # Erst Dateien entsperren (falls möglich)
-                subprocess.run(['attrib', '-R', str(path / "*"), '/S'], 
-                            capture_output=True, timeout=10)
-            except:  # noqa: E722
-                pass
-                
+        if os.name == "nt":
             try:
                 # Windows-spezifische schnelle Entfernung
-                result = subprocess.run(['cmd', '/c', 'rmdir', '/S', '/Q', str(path)], 
-                                    capture_output=True, timeout=30)
-                if result.returncode == 0:
-                    if show_progress and not self.config.get("quick_mode", False):
+                rmdir_cmd = ['cmd', '/c', 'rmdir', '/S', '/Q', str(path)]
+                result = subprocess.run(rmdir_cmd, capture_output=True, timeout=30)
+                if result.returncode != 0 or path.exists():
+                    # Nur bei Fehlschlag: schreibgeschützte Dateien entsperren und erneut versuchen
+                    try:
+                        subprocess.run(['attrib', '-R', str(path / "*"), '/S'],
+                                    capture_output=True, timeout=10)
+                    except Exception:
+                        pass
+                    result = subprocess.run(rmdir_cmd, capture_output=True, timeout=30)
+
+                if result.returncode == 0 and not path.exists():
+                    if show_progress and not self.quick_mode:
                         print("Directory successfully removed (Windows fast removal)")
                     return
                 else:
-                    print(f"[DEBUG] Windows rmdir failed with code {result.returncode}")
+                    log.debug("Windows rmdir failed with code %s", result.returncode)
                     
             except subprocess.TimeoutExpired:
-                print("[DEBUG] Windows rmdir timeout, trying fallback...")
+                log.debug("Windows rmdir timeout, trying fallback...")
             except Exception as e:
-                print(f"[DEBUG] Windows rmdir failed: {e}")
-        
-        # Fallback zu shutil.rmtree für alle Systeme
+                log.debug("Windows rmdir failed: %s", e)
+        else:
+            if _HAVE_DIR_FD:
+                # Im Prozess mit unlinkat relativ zu Verzeichnis-fds: kein fork/exec für rm,
+                # bei kleinen Bäumen (typischer Cache) mehrfach schneller, bei großen gleichauf
+                try:
+                    self._unlinkat_rmtree(path)
+                    if show_progress and not self.quick_mode:
+                        print("Directory successfully removed (unlinkat)")
+                    return
+                except OSError as e:
+                    log.debug("unlinkat removal failed: %s", e)
+            try:
+                # POSIX: natives rm -rf ist deutlich schneller als die Python-Rekursion
+                result = subprocess.run(['rm', '-rf', str(path)],
+                                    capture_output=True, timeout=120)
+                if result.returncode == 0 and not path.exists():
+                    if show_progress and not self.quick_mode:
+                        print("Directory successfully removed (rm -rf)")
+                    return
+                else:
+                    log.debug("rm -rf failed with code %s", result.returncode)
+
+            except subprocess.TimeoutExpired:
+                log.debug("rm -rf timeout, trying fallback...")
+            except Exception as e:
+                log.debug("rm -rf failed: %s", e)
+
+        # Schneller Fallback: Unterverzeichnisse parallel mit os.scandir löschen
         try:
-            shutil.rmtree(path, ignore_errors=False)
-            if show_progress and not self.config.get("quick_mode", False):
-                print("Directory successfully removed (shutil.rmtree)")
+            self._parallel_rmtree(path)
+            if show_progress and not self.quick_mode:
+                print("Directory successfully removed (scandir)")
+            return
         except Exception as e:
-            print(f"[ERROR] shutil.rmtree also failed: {e}")
-            # Letzter Versuch mit ignore_errors=True
+            log.debug("scandir removal failed: %s", e)
+
+        # Letzter Versuch: alles entfernen, was sich entfernen lässt
+        self._scandir_rmtree(path, ignore_errors=True)
+        if path.exists():
+            raise Exception("Complete removal failure: all removal methods failed")
+        if show_progress and not self.quick_mode:
+            print("Directory successfully removed (scandir with ignore_errors)")
+
+    def _unlink_missing_ok(self, path: Path) -> None:
+        """Removes a file before rewriting it, so hard-linked server JARs keep the old content"""
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    @contextlib.contextmanager
+    def _lock_path(self, lock_file: Path, description: str):
+        """Holds an exclusive lock on lock_file (fcntl.flock / msvcrt.locking) for the with block"""
+        fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    print(f"Waiting for another process working on {description}...")
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+            elif msvcrt is not None:
+                waiting = False
+                while True:
+                    try:
+                        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                        break
+                    except OSError:
+                        if not waiting:
+                            print(f"Waiting for another process working on {description}...")
+                            waiting = True
+                        time.sleep(1)
+            yield
+        finally:
+            if fcntl is None and msvcrt is not None:
+                try:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+                except OSError:
+                    pass
+            # Schließen gibt den flock frei
+            os.close(fd)
+
+    def _link_or_copy(self, src: Path, dst: Path) -> None:
+        """Hard-links a read-only file, falls back to a copy without metadata"""
+        try:
+            # Gleiches Dateisystem: Hardlink statt Kopie. Die Cache-JARs werden
+            # nie in-place überschrieben, ein Neubau trennt den Link also auf.
+            os.link(src, dst)
+        except OSError:
+            # EXDEV (anderes Dateisystem), EPERM, FAT usw.
+            self._fast_copy(src, dst, keep_metadata=False)
+
+    def _fast_copy(self, src: Path, dst: Path, keep_metadata: bool = True) -> None:
+        """Copies a file via reflink, os.copy_file_range or a 1 MiB readinto loop, keeps mode and mtime"""
+        binary = getattr(os, "O_BINARY", 0)
+        src_fd = os.open(src, os.O_RDONLY | binary)
+        try:
+            st = os.fstat(src_fd)
+            self._unlink_missing_ok(dst)
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | binary, 0o644)
             try:
-                shutil.rmtree(path, ignore_errors=True)
-                if not path.exists():
-                    if show_progress and not self.config.get("quick_mode", False):
-                        print("Directory successfully removed (shutil.rmtree with ignore_errors)")
-                else:
-                    raise Exception("All removal methods failed")
-            except Exception as final_e:
-                raise Exception(f"Complete removal failure: {final_e}")
+                cloned = False
+                if fcntl is not None and sys.platform.startswith("linux"):
+                    try:
+                        # btrfs/xfs: Copy-on-Write-Klon, nur Metadaten
+                        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+                        cloned = True
+                    except OSError:
+                        pass
+
+                if not cloned and hasattr(os, "copy_file_range"):
+                    try:
+                        remaining = st.st_size
+                        while remaining > 0:
+                            copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                            if copied == 0:
+                                break
+                            remaining -= copied
+                    except OSError:
+                        # z.B. EXDEV auf älteren Kerneln; der Rest wird unten ab dem aktuellen Offset kopiert
+                        pass
+
+                if not cloned:
+                    buf = bytearray(1024 * 1024)
+                    view = memoryview(buf)
+                    with io.FileIO(src_fd, 'rb', closefd=False) as fsrc:
+                        while True:
+                            n = fsrc.readinto(buf)
+                            if not n:
+                                break
+                            chunk = view[:n]
+                            while chunk:
+                                chunk = chunk[os.write(dst_fd, chunk):]
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+        if keep_metadata:
+            os.chmod(dst, stat.S_IMODE(st.st_mode))
+            os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    def fast_rmtree_many(self, paths: List[Path]) -> None:
+        """Removes several files/directories with a single subprocess call"""
+        import subprocess
+
+        paths = [Path(p) for p in paths if Path(p).exists()]
+        if not paths:
+            return
+
+        try:
+            if os.name == "nt":
+                # Alle Befehle in einem einzigen cmd-Aufruf verketten
+                commands = [
+                    f'rmdir /S /Q "{p}"' if p.is_dir() else f'del /F /Q "{p}"'
+                    for p in paths
+                ]
+                subprocess.run(['cmd', '/c', ' & '.join(commands)],
+                            capture_output=True, timeout=60)
+            else:
+                subprocess.run(['rm', '-rf', *map(str, paths)],
+                            capture_output=True, timeout=120)
+        except subprocess.TimeoutExpired:
+            log.debug("Batch removal timeout, trying fallback...")
+        except Exception as e:
+            log.debug("Batch removal failed: %s", e)
+
+        # Reste einzeln entfernen
+        for p in paths:
+            if p.is_dir():
+                self.fast_rmtree(p)
+            elif p.exists():
+                p.unlink()
 
     
     def download_file_parallel(self, url: str, output_path: Path, description: str = "Download") -> None:
         """Optimized download with progress indicator"""
+        import shutil
+
         try:
-            session = requests.Session()
-            session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
-            
-            response = session.get(url, stream=True, timeout=30)
-            response.raise_for_status()
-            
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            
-            # Größere Chunk-Size für bessere Performance
-            chunk_size = 32768
-        
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=chunk_size):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        if total_size > 0 and not self.config.get("quick_mode", False):
-                            percent = (downloaded / total_size) * 100
+            # 'with' gibt die Verbindung auch bei Fehlern an den Pool der Session zurück
+            with self._session.get(url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                
+                total_size = int(response.headers.get('content-length', 0))
+                show_progress = total_size > 0 and not self.quick_mode
+
+                # 1 MiB Puffer, die Kopierschleife läuft in shutil statt pro Chunk in Python
+                chunk_size = 1024 * 1024
+                response.raw.decode_content = True
+
+                self._unlink_missing_ok(output_path)
+                with open(output_path, 'wb') as f:
+                    done = threading.Event()
+
+                    def report_progress():
+                        # Fortschritt zeitbasiert (alle 250 ms) statt pro Chunk ausgeben
+                        while not done.wait(0.25):
+                            percent = min(f.tell() / total_size * 100, 100.0)
                             print(f"\r{description}: {percent:.1f}%", end='', flush=True)
-            
-            if not self.config.get("quick_mode", False):
+
+                    reporter = threading.Thread(target=report_progress, daemon=True)
+                    if show_progress:
+                        reporter.start()
+                    try:
+                        shutil.copyfileobj(response.raw, f, chunk_size)
+                    finally:
+                        done.set()
+                        if show_progress:
+                            reporter.join()
+
+            if show_progress:
+                print(f"\r{description}: 100.0%", end='', flush=True)
+
+            if not self.quick_mode:
                 print() 
                 
-        except Exception as e:
+        except BaseException as e:
+            # Abgebrochene Downloads (auch Strg+C) nicht als (scheinbar gültige) Cache-Datei liegen lassen
+            try:
+                self._unlink_missing_ok(output_path)
+            except OSError:
+                pass
+            if not isinstance(e, Exception):
+                raise
             raise Exception(f"Error during download: {e}")
     
     def try_download_prebuilt_spigot(self, version: str) -> Optional[Path]:
         """Try to download a ready-made Spigot JAR"""
+        import concurrent.futures
         if not self.config.get("use_prebuilt_spigot", True):
             return None
         
@@ -282,74 +832,139 @@ class SpigotServerCreator:
         ]
         
         all_urls = [prebuilt_urls.get(version)] + alternative_urls
-        all_urls = [url for url in all_urls if url] 
-        
-        for url in all_urls:
-            try:
-                print(f"Try to download ready-made Spigot JAR for {version}...")
-                self.download_file_parallel(url, spigot_jar, f"Spigot {version}")
+        all_urls = list(dict.fromkeys(url for url in all_urls if url))
+
+        print(f"Try to download ready-made Spigot JAR for {version}...")
+
+        # Alle Mirrors parallel per HEAD prüfen, der erste mit passender Größe gewinnt
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(all_urls))
+        futures = {executor.submit(self._probe_url, url): url for url in all_urls}
+        winner = None
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                if future.result():
+                    winner = futures[future]
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+        if not winner:
+            return None
+
+        # Erst prüfen, dann unter dem endgültigen Namen sichtbar machen
+        part_jar = spigot_jar.with_name(spigot_jar.name + ".part")
+        try:
+            self.download_file_parallel(winner, part_jar, f"Spigot {version}")
+
+            if (part_jar.stat().st_size > 1024 * 1024
+                    and self._verify_jar(part_jar, "sha256", _KNOWN_SPIGOT_SHA256.get(version))):
+                os.replace(part_jar, spigot_jar)
+                print(f"Pre-built Spigot JAR for {version} successfully downloaded!")
+                return spigot_jar
+            else:
+                part_jar.unlink()
+
+        except Exception:
+            if part_jar.exists():
+                part_jar.unlink()
 
-                if spigot_jar.stat().st_size > 1024 * 1024: 
-                    print(f"Pre-built Spigot JAR for {version} successfully downloaded!")
-                    return spigot_jar
-                else:
-                    spigot_jar.unlink()  
-                    
-            except Exception: 
-                if spigot_jar.exists():
-                    spigot_jar.unlink()
-                continue
-        
         return None
-    
+
+    def _file_digest(self, path: Path, algorithm: str) -> str:
+        """Hashes a file in C via hashlib.file_digest (3.11+) or in 1 MiB chunks"""
+        import hashlib
+
+        with open(path, 'rb') as f:
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, algorithm).hexdigest()
+            digest = hashlib.new(algorithm)
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+            return digest.hexdigest()
+
+    def _verify_jar(self, path: Path, algorithm: str, expected: Optional[str] = None) -> bool:
+        """Checks the ZIP signature and, if known, the checksum of a downloaded JAR"""
+        with open(path, 'rb') as f:
+            if f.read(4) != b"PK\x03\x04":
+                return False
+        if expected:
+            return self._file_digest(path, algorithm) == expected.lower()
+        return True
+
+    def _probe_url(self, url: str) -> bool:
+        """Checks with a HEAD request whether a URL serves a plausibly sized JAR"""
+        try:
+            response = self._session.head(url, allow_redirects=True, timeout=5)
+            # HTML-Fehlerseiten mit 200 scheiden über die Größe aus (< 1 MB)
+            return (response.status_code == 200
+                    and int(response.headers.get('content-length', 0)) > 1024 * 1024)
+        except Exception:
+            return False
+
     def download_buildtools(self, force_update: bool = False) -> Path:
         """Downloads BuildTools.jar if not available or outdated"""
         buildtools_path = self.cache_dir / "BuildTools.jar"
         
-        if buildtools_path.exists() and not force_update and not self.should_update_buildtools():
-            if not self.config.get("quick_mode", False):
+        # should_update_buildtools liefert True, wenn die Datei fehlt (nur ein stat)
+        if not force_update and not self.should_update_buildtools():
+            if not self.quick_mode:
                 print("BuildTools.jar already available and up-to-date.")
             return buildtools_path
         
+        # Parallele Batch-Worker teilen sich BuildTools.jar: nur einer lädt, die anderen nutzen das Ergebnis
+        with self._lock_path(self.cache_dir / "BuildTools.lock", "BuildTools.jar"):
+            if not force_update and not self.should_update_buildtools():
+                return buildtools_path
+            return self._download_buildtools_locked(buildtools_path)
+
+    def _download_buildtools_locked(self, buildtools_path: Path) -> Path:
+        """Downloads BuildTools.jar; the caller holds the BuildTools lock"""
         print("Download BuildTools.jar...")
         url = "https://hub.spigotmc.org/jenkins/job/BuildTools/lastSuccessfulBuild/artifact/target/BuildTools.jar"
         
+        # Über eine .part-Datei: die alte BuildTools.jar bleibt bis zum vollständigen Download unverändert
+        part_path = buildtools_path.with_name(buildtools_path.name + ".part")
         try:
-            if buildtools_path.exists():
-                backup_path = buildtools_path.with_suffix('.jar.backup')
-                shutil.move(buildtools_path, backup_path)
+            self.download_file_parallel(url, part_path, "BuildTools")
+            os.replace(part_path, buildtools_path)
             
-            self.download_file_parallel(url, buildtools_path, "BuildTools")
-            
-            if not self.config.get("quick_mode", False):
+            if not self.quick_mode:
                 print("BuildTools.jar successfully downloaded.")
             return buildtools_path
             
         except Exception as e:
-            backup_path = buildtools_path.with_suffix('.jar.backup')
-            if backup_path.exists():
-                shutil.move(backup_path, buildtools_path)
-                print("Backup of BuildTools.jar restored.")
+            if buildtools_path.exists():
+                print("Download failed, keeping the existing BuildTools.jar.")
                 return buildtools_path
             
             raise Exception(f"Error downloading BuildTools.jar: {e}")
         
-    SUPPORTED_BUKKIT_VERSIONS = [
-    "1.21.4", "1.21.3", "1.21.2", "1.21.1", "1.21",
-    "1.20.6", "1.20.5", "1.20.4", "1.20.3", "1.20.2", "1.20.1", "1.20",
-    "1.19.4", "1.19.3", "1.19.2", "1.19.1", "1.19",
-    "1.18.2", "1.18.1", "1.18",
-    "1.17.1", "1.17",
-    "1.16.5", "1.16.4", "1.16.3", "1.16.2", "1.16.1",
-    "1.15.2", "1.15.1", "1.15",
-    "1.14.4", "1.14.3", "1.14.2", "1.14.1", "1.14",
-    "1.13.2", "1.13.1", "1.13",
-    "1.12.2", "1.12.1", "1.12",
-    "1.11.2", "1.11.1", "1.11",
-    "1.10.2", "1.10",
-    "1.9.4", "1.9.2", "1.9",
-    "1.8.8"
-]
+    # CraftBukkit gibt es für dieselben Versionen wie Spigot
+    SUPPORTED_BUKKIT_VERSIONS = frozenset(_SPIGOT_VERSIONS)
+
+    def _bukkit_url(self, version: str) -> str:
+        """Returns the CraftBukkit download URL for a version"""
+        return f"https://cdn.getbukkit.org/craftbukkit/craftbukkit-{version}.jar"
+
+    def precheck_bukkit(self, versions: List[str]) -> Dict[str, bool]:
+        """Checks the availability of several Bukkit versions in parallel"""
+        import concurrent.futures
+        pending = [v for v in dict.fromkeys(versions) if self._bukkit_url(v) not in self._bukkit_head_cache]
+
+        def head_task(version):
+            url = self._bukkit_url(version)
+            try:
+                self._bukkit_head_cache[url] = self._session.head(url, timeout=10).status_code
+            except Exception:
+                self._bukkit_head_cache[url] = 0
+
+        if pending:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+                list(executor.map(head_task, pending))
+
+        return {v: self._bukkit_head_cache.get(self._bukkit_url(v)) == 200 for v in versions}
 
     def download_bukkit(self, version: str) -> Path:
         """Download Bukkit JAR"""
@@ -359,17 +974,25 @@ class SpigotServerCreator:
                 "Siehe https://getbukkit.org/download/craftbukkit für unterstützte Versionen."
             )
         bukkit_jar = self.cache_dir / f"bukkit-{version}.jar"
-        url = f"https://cdn.getbukkit.org/craftbukkit/craftbukkit-{version}.jar"
-        response = requests.head(url)
-        if response.status_code != 200:
+        # Bereits gecachte JAR braucht keine HEAD-Anfrage
+        try:
+            if bukkit_jar.stat().st_size > 1024 * 1024:
+                return bukkit_jar
+        except FileNotFoundError:
+            pass
+
+        url = self._bukkit_url(version)
+        if not self.precheck_bukkit([version])[version]:
             raise Exception(
                 f"Bukkit/CraftBukkit JAR for version {version} not found at {url}.\n"
                 "Hinweis: Bukkit/CraftBukkit ist nicht für alle Minecraft-Versionen verfügbar. "
                 "Siehe https://getbukkit.org/download/craftbukkit für verfügbare Versionen."
             )  
-        if not bukkit_jar.exists():
-            print(f"Downloading Bukkit {version} ...")
-            self.download_file_parallel(url, bukkit_jar, f"Bukkit {version}")
+        print(f"Downloading Bukkit {version} ...")
+        # Erst nach vollständigem Download unter dem endgültigen Namen sichtbar machen
+        part_jar = bukkit_jar.with_name(bukkit_jar.name + ".part")
+        self.download_file_parallel(url, part_jar, f"Bukkit {version}")
+        os.replace(part_jar, bukkit_jar)
         return bukkit_jar
 
     def download_vanilla(self, version: str) -> Path:
@@ -380,19 +1003,80 @@ class SpigotServerCreator:
             raise Exception(f"Could not find download URL for vanilla version {version}")
         if not vanilla_jar.exists():
             print(f"Downloading Vanilla Minecraft {version} ...")
-            self.download_file_parallel(url, vanilla_jar, f"Vanilla {version}")
+            # Erst prüfen, dann unter dem endgültigen Namen sichtbar machen
+            part_jar = vanilla_jar.with_name(vanilla_jar.name + ".part")
+            self.download_file_parallel(url, part_jar, f"Vanilla {version}")
+            # Mojang liefert die SHA-1 im Versions-Manifest mit
+            if not self._verify_jar(part_jar, "sha1", self.get_vanilla_hash(version)):
+                part_jar.unlink()
+                raise Exception(f"Checksum mismatch for vanilla {version} download")
+            os.replace(part_jar, vanilla_jar)
         return vanilla_jar
 
-    def get_vanilla_hash(self, version: str) -> str:
-        """Fetches the Mojang hash for a given version from the official manifest."""
+    def _load_cached_json(self, cache_file: Path, url: str) -> Dict:
+        """Loads JSON from the disk cache (TTL) or revalidates it with a conditional request"""
         try:
-            manifest_url = "https://launchermeta.mojang.com/mc/game/version_manifest.json"
-            manifest = requests.get(manifest_url, timeout=10).json()
-            version_info = next((v for v in manifest["versions"] if v["id"] == version), None)
+            if time.time() - cache_file.stat().st_mtime < self.config["buildtools_update_interval"]:
+                return _loads(_read_bytes(cache_file))
+        except (OSError, ValueError):
+            pass
+
+        # ETag/Last-Modified der letzten Antwort mitschicken, damit der Server mit 304 antworten kann
+        meta_file = cache_file.with_name(cache_file.name + ".meta")
+        headers = {}
+        if cache_file.exists():
+            try:
+                meta = _loads(_read_bytes(meta_file))
+                if meta.get("etag"):
+                    headers["If-None-Match"] = meta["etag"]
+                if meta.get("last_modified"):
+                    headers["If-Modified-Since"] = meta["last_modified"]
+            except (OSError, ValueError):
+                pass
+
+        response = self._session.get(url, headers=headers, timeout=10)
+        if response.status_code == 304:
+            try:
+                data = _read_bytes(cache_file)
+                os.utime(cache_file)
+                return _loads(data)
+            except (OSError, ValueError):
+                response = self._session.get(url, timeout=10)
+
+        response.raise_for_status()
+        data = response.content
+        cache_file.write_bytes(data)
+        meta_file.write_bytes(_dumps({
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified")
+        }, indent=False))
+        return _loads(data)
+
+    def _get_manifest(self) -> Dict[str, Dict]:
+        """Loads the Mojang version manifest once and indexes it by version id"""
+        if self._manifest_by_id is None:
+            manifest = self._load_cached_json(
+                self.cache_dir / "version_manifest.json",
+                "https://launchermeta.mojang.com/mc/game/version_manifest.json"
+            )
+            self._manifest_by_id = {v["id"]: v for v in manifest["versions"]}
+        return self._manifest_by_id
+
+    def _get_version_json(self, version: str) -> Dict:
+        """Fetches the Mojang version JSON, manifest and version data are cached"""
+        if version not in self._version_json_cache:
+            version_info = self._get_manifest().get(version)
             if not version_info:
                 raise Exception(f"Version {version} not found in Mojang manifest.")
-            version_json = requests.get(version_info["url"], timeout=10).json()
-            return version_json["downloads"]["server"]["sha1"]
+            self._version_json_cache[version] = self._load_cached_json(
+                self.cache_dir / f"version-{version}.json", version_info["url"]
+            )
+        return self._version_json_cache[version]
+
+    def get_vanilla_hash(self, version: str) -> str:
+        """Fetches the Mojang hash for a given version from the official manifest."""
+        try:
+            return self._get_version_json(version)["downloads"]["server"]["sha1"]
         except Exception as e:
             print(f"Could not fetch vanilla hash for {version}: {e}")
             return ""
@@ -400,13 +1084,7 @@ class SpigotServerCreator:
     def get_vanilla_server_url(self, version: str) -> str:
         """Fetches the Mojang server JAR URL for a given version."""
         try:
-            manifest_url = "https://launchermeta.mojang.com/mc/game/version_manifest.json"
-            manifest = requests.get(manifest_url, timeout=10).json()
-            version_info = next((v for v in manifest["versions"] if v["id"] == version), None)
-            if not version_info:
-                raise Exception(f"Version {version} not found in Mojang manifest.")
-            version_json = requests.get(version_info["url"], timeout=10).json()
-            return version_json["downloads"]["server"]["url"]
+            return self._get_version_json(version)["downloads"]["server"]["url"]
         except Exception as e:
             print(f"Could not fetch vanilla server URL for {version}: {e}")
             return ""
@@ -416,240 +1094,272 @@ class SpigotServerCreator:
         spigot_jar = self.cache_dir / f"spigot-{version}.jar"
 
         if spigot_jar.exists() and not force_rebuild:
-            if not self.config.get("quick_mode", False):
+            if not self.quick_mode:
                 print(f"Spigot {version} already created.")
             return spigot_jar
 
+        # Nur ein Prozess baut dieselbe Version, die anderen warten und nutzen danach den Cache
+        with self._lock_path(self.cache_dir / f"spigot-{version}.lock", f"Spigot {version}"):
+            if spigot_jar.exists() and not force_rebuild:
+                if not self.quick_mode:
+                    print(f"Spigot {version} was created by another process.")
+                return spigot_jar
+            return self._build_spigot_locked(version, spigot_jar, refresh_java=force_rebuild)
+
+    def _build_spigot_locked(self, version: str, spigot_jar: Path, refresh_java: bool = False) -> Path:
+        """Downloads or builds a Spigot JAR; the caller holds the version lock"""
+        import subprocess
+        import tempfile
+
         prebuilt_jar = self.try_download_prebuilt_spigot(version)
         if prebuilt_jar:
             return prebuilt_jar
 
         print(f"Create spigot {version} with BuildTools...")
 
-        if not self.check_java_version():
+        # Java wird nur für BuildTools gebraucht; das Ergebnis ist pro Instanz gemerkt,
+        # bei force_rebuild wird 'java -version' erneut ausgeführt
+        if not self.check_java_version(refresh=refresh_java):
             raise Exception("Java check failed")
 
         buildtools_path = self.download_buildtools()
 
+        temp_path = Path(tempfile.mkdtemp(prefix="spigot-build-"))
+        backup_path = buildtools_path.with_suffix('.jar.backup')
+
         try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                temp_buildtools = temp_path / "BuildTools.jar"
-                shutil.copy2(buildtools_path, temp_buildtools)
-
-                cmd = [
-                    self.config["java_path"],
-                    "-Xmx2G",
-                    "-jar", str(temp_buildtools),
-                    "--rev", version,
-                    "--output-dir", str(temp_path),
-                    "--compile", "spigot",
-                    "--disable-certificate-check"
-                ]
+            temp_buildtools = temp_path / "BuildTools.jar"
+            self._link_or_copy(buildtools_path, temp_buildtools)
 
-                if version.startswith(("1.19", "1.20", "1.21")):
-                    cmd.append("--disable-java-check")
+            cmd = [
+                self.config["java_path"],
+                "-Xmx2G",
+                "-jar", str(temp_buildtools),
+                "--rev", version,
+                "--output-dir", str(temp_path),
+                "--compile", "spigot",
+                "--disable-certificate-check"
+            ]
 
-                if not self.config.get("quick_mode", False):
-                    print(f"Execute: {' '.join(cmd)}")
-                    print("This may take a few minutes...")
+            if version.startswith(("1.19", "1.20", "1.21")):
+                cmd.append("--disable-java-check")
 
-                env = dict(os.environ)
-                env.update({
-                    "MAVEN_OPTS": "-Xmx2G -XX:+UseG1GC",
-                    "JAVA_TOOL_OPTIONS": "-Xmx2G"
-                })
+            if not self.quick_mode:
+                print(f"Execute: {' '.join(cmd)}")
+                print("This may take a few minutes...")
 
-                if self.config.get("quick_mode", False):
+            env = dict(os.environ)
+            env.update({
+                "MAVEN_OPTS": "-Xmx2G -XX:+UseG1GC",
+                "JAVA_TOOL_OPTIONS": "-Xmx2G"
+            })
+
+            log_file = self.cache_dir / f"buildtools-{version}.log"
+            if self.quick_mode:
+                # Ausgabe geht direkt in die Log-Datei, Python liest keine Pipe mit
+                with open(log_file, 'wb') as log_fh:
                     result = subprocess.run(
                         cmd,
                         cwd=temp_path,
-                        capture_output=True,
-                        text=True,
+                        stdout=log_fh,
+                        stderr=subprocess.STDOUT,
                         env=env,
                         timeout=1800
                     )
-                    if result.returncode != 0:
-                        print("BuildTools error:")
-                        print(result.stdout[-1000:])
-                        print(result.stderr[-1000:])
-                        raise Exception(f"BuildTools failed with exit code: {result.returncode}")
+                if result.returncode != 0:
+                    print(f"BuildTools error (log: {log_file}):")
+                    with open(log_file, 'rb') as log_fh:
+                        log_fh.seek(max(log_fh.seek(0, os.SEEK_END) - 2000, 0))
+                        print(log_fh.read().decode(errors='replace'))
+                    raise Exception(f"BuildTools failed with exit code: {result.returncode}")
+            else:
+                print(f"BuildTools output (log: {log_file}):")
+                process = subprocess.Popen(
+                    cmd,
+                    cwd=temp_path,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=65536,
+                    env=env
+                )
+                # Ausgabe blockweise statt zeilenweise weiterreichen
+                sys.stdout.flush()
+                out = getattr(sys.stdout, 'buffer', None)
+                with open(log_file, 'wb') as log_fh:
+                    for chunk in iter(lambda: process.stdout.read1(65536), b''):
+                        log_fh.write(chunk)
+                        if out is not None:
+                            out.write(chunk)
+                            out.flush()
+                        else:
+                            sys.stdout.write(chunk.decode(errors='replace'))
+                process.wait()
+                if process.returncode != 0:
+                    raise Exception(f"BuildTools failed with exit code:{process.returncode}")
+
+            built_jar = temp_path / f"spigot-{version}.jar"
+            if not built_jar.exists():
+                jar_files = list(temp_path.glob("spigot*.jar"))
+                if jar_files:
+                    built_jar = jar_files[0]
+                    print(f"Spigot JAR found: {built_jar}")
                 else:
-                    process = subprocess.Popen(
-                        cmd,
-                        cwd=temp_path,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        text=True,
-                        bufsize=1,
-                        universal_newlines=True,
-                        env=env
-                    )
-                    for line in process.stdout:
-                        print(f"BuildTools: {line.strip()}")
-                    process.wait()
-                    if process.returncode != 0:
-                        raise Exception(f"BuildTools failed with exit code:{process.returncode}")
-
-                built_jar = temp_path / f"spigot-{version}.jar"
-                if not built_jar.exists():
-                    jar_files = list(temp_path.glob("spigot*.jar"))
-                    if jar_files:
-                        built_jar = jar_files[0]
-                        print(f"Spigot JAR found: {built_jar}")
-                    else:
-                        raise Exception(f"Spigot JAR not found in: {temp_path}")
+                    raise Exception(f"Spigot JAR not found in: {temp_path}")
 
-                shutil.copy2(built_jar, spigot_jar)
-                print(f"Spigot {version} successfully created and saved in the cache.")
+            # Über eine .part-Datei, damit andere Prozesse nie ein halbes JAR sehen
+            part_jar = spigot_jar.with_name(spigot_jar.name + ".part")
+            self._fast_copy(built_jar, part_jar)
+            os.replace(part_jar, spigot_jar)
+            print(f"Spigot {version} successfully created and saved in the cache.")
 
-                return spigot_jar
+            return spigot_jar
 
         except subprocess.TimeoutExpired:
             raise Exception("BuildTools timeout - build took too long")
         except Exception as e:
             raise Exception(f"Error when creating spigot: {e}")
+        finally:
+            # Temp-Build-Verzeichnis und veraltetes BuildTools-Backup in einem Aufruf entfernen
+            self.fast_rmtree_many([temp_path, backup_path])
     
     def build_spigot(self, version: str, force_rebuild: bool = False) -> Path:
         """Wrapper for optimized spigot creation"""
         return self.build_spigot_optimized(version, force_rebuild)
     
-    def create_files_parallel(self, server_dir: Path, name: str, version: str, port: int, memory: str, **kwargs) -> None:
-        """Creates all server files in parallel"""
-        def create_server_properties_task():
-            self.create_server_properties(server_dir, port, **kwargs)
-        
-        def create_eula_task():
-            self.create_eula_txt(server_dir)
-        
-        def create_start_script_task():
-            self.create_start_script(server_dir, f"spigot-{version}.jar", memory)
-        
-        def create_server_info_task():
-            self.create_server_info(server_dir, name, version, port, memory)
-        
-        def create_readme_task():
-            self.create_readme(server_dir, name, version, port, memory)
-        
-        def create_directories_task():
-            (server_dir / "plugins").mkdir(exist_ok=True)
-            (server_dir / "world").mkdir(exist_ok=True)
-            (server_dir / "logs").mkdir(exist_ok=True)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=6) as executor:
-            futures = [
-                executor.submit(create_server_properties_task),
-                executor.submit(create_eula_task),
-                executor.submit(create_start_script_task),
-                executor.submit(create_server_info_task),
-                executor.submit(create_readme_task),
-                executor.submit(create_directories_task)
-            ]
+    def _write_bytes(self, path: Path, data: bytes, mode: int = 0o644) -> None:
+        """Writes a small file with a single open/write/close (no buffered I/O layer)"""
+        view = memoryview(data)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), mode)
+        try:
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+    def _write_bytes_atomic(self, path: Path, data: bytes, mode: int = 0o644) -> None:
+        """Writes a file via a temporary sibling and os.replace, readers never see a partial file"""
+        # Eindeutig pro Prozess/Thread; anders als mkstemp (0600) gilt mode wie bei _write_bytes
+        tmp_name = os.path.join(path.parent, f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        try:
+            fd = os.open(tmp_name, flags, mode)
+        except FileExistsError:
+            # Rest eines abgebrochenen Prozesses mit derselben PID
+            os.unlink(tmp_name)
+            fd = os.open(tmp_name, flags, mode)
+        try:
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
 
-            concurrent.futures.wait(futures)
+    def _write_file(self, path: Path, content: str, mode: int = 0o644, ignore_stamp: bool = False) -> None:
+        """Writes a small text file with the platform line ending"""
+        if os.linesep != "\n":
+            content = content.replace("\n", os.linesep)
+        # UTF-8 statt ASCII: MOTD und Servername sind Benutzereingaben, die README enthält Umlaute
+        self._write_bytes_if_changed(path, content.encode('utf-8'), mode, ignore_stamp)
 
-            for future in futures:
-                try:
-                    future.result()
-                except Exception as e:
-                    print(f"Error when creating the files: {e}")
+    def _write_bytes_if_changed(self, path: Path, data: bytes, mode: int = 0o644,
+                                ignore_stamp: bool = False) -> None:
+        """Skips the write (and the mtime change) when the file already has this content;
+        with ignore_stamp a differing creation timestamp alone does not count as a change"""
+        try:
+            # Ein Byte mehr lesen, damit längere Dateien nicht als gleich gelten
+            old = _read_bytes(path, len(data) + 1)
+        except OSError:
+            old = None
+        if old is not None:
+            if old == data:
+                return
+            # Zeitstempel haben feste Länge; dann bleibt die alte Datei samt altem Zeitstempel
+            if ignore_stamp and _STAMP_RE.sub(b"", old) == _STAMP_RE.sub(b"", data):
+                return
+        self._write_bytes(path, data, mode)
+
+    def create_files_parallel(self, server_dir: Path, name: str, version: str, port: int, memory: str,
+                              options: Optional[CreateOptions] = None) -> None:
+        """Creates all server files (small writes, so sequential is faster than a thread pool)"""
+        if options is None:
+            options = CreateOptions()
+        tasks = [
+            lambda: self.create_server_properties(server_dir, port, options),
+            lambda: self.create_eula_txt(server_dir),
+            lambda: self.create_start_script(server_dir, _jar_name(options.type, version), memory),
+            lambda: self.create_server_info(server_dir, name, version, port, memory),
+            lambda: self.create_readme(server_dir, name, version, port, memory),
+        ]
+        for task in tasks:
+            try:
+                task()
+            except Exception as e:
+                print(f"Error when creating the files: {e}")
+
+        # server_dir existiert bereits (create_server), also ein mkdir pro Unterordner
+        for sub in ("plugins", "world", "logs"):
+            try:
+                os.mkdir(os.path.join(server_dir, sub))
+            except FileExistsError:
+                pass
     
-    def create_server_properties(self, server_dir: Path, port: int = 25565, **kwargs) -> None:
+    def create_server_properties(self, server_dir: Path, port: int = 25565, options: Optional[CreateOptions] = None) -> None:
         """Creates server.properties file with advanced options"""
+        if options is None:
+            options = CreateOptions()
         properties = {
             "server-port": port,
-            "gamemode": kwargs.get("gamemode", "creative"),
-            "difficulty": kwargs.get("difficulty", "peaceful"),
-            "spawn-protection": kwargs.get("spawn_protection", 0),
-            "max-players": kwargs.get("max_players", 10),
-            "online-mode": kwargs.get("online_mode", False),
-            "pvp": kwargs.get("pvp", False),
-            "enable-command-block": kwargs.get("enable_command_block", True),
-            "motd": kwargs.get("motd", "Spigot Test Server"),
-            "white-list": kwargs.get("whitelist", False),
-            "enforce-whitelist": kwargs.get("enforce_whitelist", False),
-            "spawn-monsters": kwargs.get("spawn_monsters", True),
-            "spawn-animals": kwargs.get("spawn_animals", True),
-            "spawn-npcs": kwargs.get("spawn_npcs", True),
-            "allow-flight": kwargs.get("allow_flight", True),
-            "view-distance": kwargs.get("view_distance", 10),
-            "simulation-distance": kwargs.get("simulation_distance", 10)
+            "gamemode": options.gamemode,
+            "difficulty": options.difficulty,
+            "spawn-protection": options.spawn_protection,
+            "max-players": options.max_players,
+            "online-mode": options.online_mode,
+            "pvp": options.pvp,
+            "enable-command-block": options.enable_command_block,
+            "motd": options.motd,
+            "white-list": options.whitelist,
+            "enforce-whitelist": options.enforce_whitelist,
+            "spawn-monsters": options.spawn_monsters,
+            "spawn-animals": options.spawn_animals,
+            "spawn-npcs": options.spawn_npcs,
+            "allow-flight": options.allow_flight,
+            "view-distance": options.view_distance,
+            "simulation-distance": options.simulation_distance
         }
 
+        content = "\n".join([
+            _PROPERTIES_HEADER,
+            f"# {time.strftime('%Y-%m-%d %H:%M:%S')}",
+            *(f"{key}={value}" for key, value in properties.items())
+        ]) + "\n"
+
         properties_file = server_dir / "server.properties"
-        with open(properties_file, 'w', encoding='utf-8') as f:
-            f.write("# Minecraft server properties\n")
-            f.write("# Generated by Spigot Server Creator\n")
-            f.write(f"# {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            for key, value in properties.items():
-                f.write(f"{key}={value}\n")
+        self._write_file(properties_file, content, ignore_stamp=True)
     
     def create_eula_txt(self, server_dir: Path) -> None:
         """Creates eula.txt file"""
-        eula_file = server_dir / "eula.txt"
-        with open(eula_file, 'w', encoding='utf-8') as f:
-            f.write("# EULA Agreement\n")
-            f.write("# By changing the setting below to TRUE you are indicating your agreement to our EULA\n")
-            f.write("# https://account.mojang.com/documents/minecraft_eula\n")
-            f.write("eula=true\n")
+        self._write_bytes_if_changed(server_dir / "eula.txt", _EULA_BYTES)
     
     def create_start_script(self, server_dir: Path, jar_name: str, memory: str = "2G") -> None:
         """Creates start scripts for the server with optimized JVM arguments"""
 
-        jvm_args = [
-            f"-Xmx{memory}",
-            f"-Xms{memory}",
-            "-XX:+UseG1GC",
-            "-XX:+ParallelRefProcEnabled",
-            "-XX:MaxGCPauseMillis=200",
-            "-XX:+UnlockExperimentalVMOptions",
-            "-XX:+DisableExplicitGC",
-            "-XX:+AlwaysPreTouch",
-            "-XX:G1NewSizePercent=30",
-            "-XX:G1MaxNewSizePercent=40",
-            "-XX:G1HeapRegionSize=8M",
-            "-XX:G1ReservePercent=20",
-            "-XX:G1HeapWastePercent=5",
-            "-XX:G1MixedGCCountTarget=4",
-            "-XX:InitiatingHeapOccupancyPercent=15",
-            "-XX:G1MixedGCLiveThresholdPercent=90",
-            "-XX:G1RSetUpdatingPauseTimePercent=5",
-            "-XX:SurvivorRatio=32",
-            "-XX:+PerfDisableSharedMem",
-            "-XX:MaxTenuringThreshold=1",
-            "-Dusing.aikars.flags=https://mcflags.emc.gs",
-            "-Daikars.new.flags=true"
-        ]
-        
-        java_cmd = f"{self.config['java_path']} {' '.join(jvm_args)} -jar {jar_name} nogui"
+        java_cmd = f"{self.config['java_path']} -Xmx{memory} -Xms{memory} {_AIKAR_FLAGS} -jar {jar_name} nogui"
 
         start_sh = server_dir / "start.sh"
-        with open(start_sh, 'w', encoding='utf-8') as f:
-            f.write("#!/bin/bash\n")
-            f.write("# Minecraft Spigot Server Start Script\n")
-            f.write("# Generated by Spigot Server Creator\n\n")
-            f.write("echo 'Starting Minecraft Spigot Server...'\n")
-            f.write("echo 'Memory allocation: " + memory + "'\n")
-            f.write("echo 'Java command: " + java_cmd + "'\n")
-            f.write("echo ''\n\n")
-            f.write(java_cmd + "\n")
-            f.write("\necho 'Server stopped.'\n")
-            f.write("read -p 'Press enter to continue...'\n")
+        self._write_file(start_sh, _SH_TEMPLATE.format(memory=memory, java_cmd=java_cmd), 0o755)
+        # mode von os.open gilt nur für neue Dateien; auch ein bestehendes (ggf. unverändertes)
+        # start.sh wieder ausführbar machen
         start_sh.chmod(0o755)
 
-        start_bat = server_dir / "start.bat"
-        with open(start_bat, 'w', encoding='utf-8') as f:
-            f.write("@echo off\n")
-            f.write("REM Minecraft Spigot Server Start Script\n")
-            f.write("REM Generated by Spigot Server Creator\n\n")
-            f.write("echo Starting Minecraft Spigot Server...\n")
-            f.write(f"echo Memory allocation: {memory}\n")
-            f.write(f"echo Java command: {java_cmd}\n")
-            f.write("echo.\n\n")
-            f.write(java_cmd + "\n")
-            f.write("\necho Server stopped.\n")
-            f.write("pause\n")
+        self._write_file(server_dir / "start.bat", _BAT_TEMPLATE.format(memory=memory, java_cmd=java_cmd))
     
     def create_server_info(self, server_dir: Path, name: str, version: str, port: int, memory: str) -> None:
         """Erstellt eine Info-Datei für den Server"""
@@ -663,142 +1373,118 @@ class SpigotServerCreator:
         }
         
         info_file = server_dir / "server_info.json"
-        with open(info_file, 'w', encoding='utf-8') as f:
-            json.dump(info, f, indent=2)
+        self._write_bytes_if_changed(info_file, _dumps(info), ignore_stamp=True)
     
     def create_readme(self, server_dir: Path, name: str, version: str, port: int, memory: str) -> None:
         """Creates README-Datei"""
         readme_file = server_dir / "README.md"
-        with open(readme_file, 'w', encoding='utf-8') as f:
-            f.write(f"# Minecraft Spigot Server: {name}\n\n")
-            f.write(f"**Version:** {version}\n")
-            f.write(f"**Port:** {port}\n")
-            f.write(f"**Memory:** {memory}\n")
-            f.write(f"**Erstellt:** {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write("## Starts\n")
-            f.write("- **Linux/Mac:** `./start.sh`\n")
-            f.write("- **Windows:** `start.bat`\n\n")
-            f.write("## Directorys\n")
-            f.write("- `plugins/` - Für Plugins\n")
-            f.write("- `world/` - Spielwelt\n")
-            f.write("- `logs/` - Server-Logs\n\n")
-            f.write("## Configuration\n")
-            f.write("- `server.properties` - Server-Einstellungen\n")
-            f.write("- `server_info.json` - Server-Informationen\n")
-
-    def create_server(self, name: str, version: str, port: int = 25565, memory: str = "2G", **kwargs) -> Path:
+        self._write_file(readme_file,
+            f"# Minecraft Spigot Server: {name}\n\n"
+            f"**Version:** {version}\n"
+            f"**Port:** {port}\n"
+            f"**Memory:** {memory}\n"
+            f"**Erstellt:** {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            "## Starts\n"
+            "- **Linux/Mac:** `./start.sh`\n"
+            "- **Windows:** `start.bat`\n\n"
+            "## Directorys\n"
+            "- `plugins/` - Für Plugins\n"
+            "- `world/` - Spielwelt\n"
+            "- `logs/` - Server-Logs\n\n"
+            "## Configuration\n"
+            "- `server.properties` - Server-Einstellungen\n"
+            "- `server_info.json` - Server-Informationen\n",
+            ignore_stamp=True
+        )
+
+    def create_server(self, name: str, version: str, port: int = 25565, memory: str = "2G", *,
+                      options: Optional[CreateOptions] = None) -> Path:
         """Creates a new Minecraft Server (Spigot/Bukkit/Vanilla) - OPTIMIZED VERSION WITH BUGFIX"""
-        server_type = kwargs.get('type', 'spigot')
+        if options is None:
+            options = CreateOptions()
+        server_type = options.type
         server_dir = self.servers_dir / name
         
-        print(f"[DEBUG] Server directory: {server_dir}")
-        print(f"[DEBUG] Directory exists: {server_dir.exists()}")
+        # Nur ein stat für den Existenz-Check, das Ergebnis wird weitergereicht
+        existed = server_dir.is_dir()
+        removed = False
+
+        log.debug("Server directory: %s", server_dir)
+        log.debug("Directory exists: %s", existed)
         
         # Handle existing server with optimized removal
-        if server_dir.exists():
-            if kwargs.get('force_overwrite', False):
-                print(f"Force overwriting existing server '{name}'...")
-                try:
-                    self.fast_rmtree(server_dir, show_progress=True)
-                    print("[DEBUG] Force removal completed")
-                except Exception as e:
-                    print(f"[ERROR] Force removal failed: {e}")
-                    raise
-                    
-                print("[DEBUG] Starting removal process...")
-                try:
-                    # Check if directory is accessible
-                    contents = list(server_dir.iterdir())
-                    print(f"[DEBUG] Directory contains {len(contents)} items")
-                    
-                    # BUGFIX: Immer fast_rmtree verwenden, unabhängig von der Anzahl der Dateien
-                    print("Removing existing server directory...")
-                    self.fast_rmtree(server_dir, show_progress=True)
-                    
-                    print("[DEBUG] Removal completed successfully")
-                    
-                    # Verify removal
-                    if server_dir.exists():
-                        print("[ERROR] Directory still exists after removal!")
-                        # BUGFIX: Zweiter Versuch mit shutil.rmtree wenn fast_rmtree fehlschlägt
-                        print("[DEBUG] Trying fallback removal method...")
-                        shutil.rmtree(server_dir, ignore_errors=True)
-                        
-                        # Nochmal prüfen
-                        if server_dir.exists():
-                            raise Exception("Directory removal failed - directory still exists after fallback")
-                        else:
-                            print("[DEBUG] Fallback removal successful")
-                    else:
-                        print("[DEBUG] Directory successfully removed")
-                        
-                except PermissionError as e:  # <-- Korrekt eingerückt!
-                    print(f"[ERROR] Permission denied: {e}")
-                    print("Make sure no files are open and you have write permissions.")
-                    print("Try running the command as administrator or closing any open files.")
-                    raise
-                except Exception as e:       
-                    print(f"[ERROR] Removal failed: {e}")
-                    print(f"[DEBUG] Directory still exists: {server_dir.exists()}")
-                    if server_dir.exists():
-                        try:
-                            contents = list(server_dir.iterdir())
-                            print(f"[DEBUG] Directory still contains: {[f.name for f in contents[:5]]}")
-                        except:  # noqa: E722
-                            print("[DEBUG] Cannot list directory contents")
-                    raise
+        if existed and options.force_overwrite:
+            print(f"Force overwriting existing server '{name}'...")
+            try:
+                # fast_rmtree probiert alle Fallbacks und wirft, wenn das Verzeichnis bleibt
+                self.fast_rmtree(server_dir, show_progress=True)
+                removed = True
+                log.debug("Removal completed successfully")
+            except PermissionError as e:
+                log.error("Permission denied: %s", e)
+                print("Make sure no files are open and you have write permissions.")
+                print("Try running the command as administrator or closing any open files.")
+                raise
+            except Exception as e:
+                log.error("Removal failed: %s", e)
+                if log.isEnabledFor(logging.DEBUG):
+                    try:
+                        contents = list(server_dir.iterdir())
+                        log.debug("Directory still contains: %s", [f.name for f in contents[:5]])
+                    except OSError:
+                        log.debug("Cannot list directory contents")
+                raise
         
-        print("[DEBUG] Starting server creation...")
+        log.debug("Starting server creation...")
         start_time = time.time()
         print(f"Creating server '{name}' with version {version}...")
         
-        # Create server directory
+        # Create server directory (nach dem Löschen wirft mkdir, falls doch noch etwas übrig ist)
         try:
-            server_dir.mkdir(parents=True, exist_ok=True)
-            print(f"[DEBUG] Created server directory: {server_dir}")
+            server_dir.mkdir(parents=True, exist_ok=not removed)
+            log.debug("Created server directory: %s", server_dir)
         except Exception as e:
-            print(f"[ERROR] Failed to create server directory: {e}")
+            log.error("Failed to create server directory: %s", e)
             raise
         
         # Get appropriate JAR based on server type
         try:
-            print(f"[DEBUG] Getting {server_type} JAR for version {version}")
+            log.debug("Getting %s JAR for version %s", server_type, version)
             if server_type == 'spigot':
-                jar_path = self.build_spigot(version, kwargs.get('force_rebuild', False))
-                jar_name = f"spigot-{version}.jar"
+                jar_path = self.build_spigot(version, options.force_rebuild)
             elif server_type == 'bukkit':
                 jar_path = self.download_bukkit(version)
-                jar_name = f"bukkit-{version}.jar"
             elif server_type == 'vanilla':
                 jar_path = self.download_vanilla(version)
-                jar_name = f"minecraft_server.{version}.jar"
             else:
                 raise Exception(f"Unknown server type: {server_type}")
+            jar_name = _jar_name(server_type, version)
             
-            print(f"[DEBUG] JAR obtained: {jar_path}")
+            log.debug("JAR obtained: %s", jar_path)
         except Exception as e:
-            print(f"[ERROR] Failed to get {server_type} JAR: {e}")
+            log.error("Failed to get %s JAR: %s", server_type, e)
             raise
         
         # Copy JAR file efficiently
         try:
             server_jar = server_dir / jar_name
-            if not server_jar.exists():
-                if not self.config.get("quick_mode", False):
+            if not existed or removed or not server_jar.exists():
+                if not self.quick_mode:
                     print(f"Copying {server_type} JAR...")
-                shutil.copy2(jar_path, server_jar)
-                print(f"[DEBUG] JAR copied to: {server_jar}")
+                self._link_or_copy(jar_path, server_jar)
+                log.debug("JAR copied to: %s", server_jar)
         except Exception as e:
-            print(f"[ERROR] Failed to copy JAR: {e}")
+            log.error("Failed to copy JAR: %s", e)
             raise
         
         # Create all server files in parallel
         try:
-            print("[DEBUG] Creating server files...")
-            self.create_files_parallel(server_dir, name, version, port, memory, **kwargs)
-            print("[DEBUG] Server files created")
+            log.debug("Creating server files...")
+            files_start = time.perf_counter()
+            self.create_files_parallel(server_dir, name, version, port, memory, options)
+            log.debug("Server files created in %.2f ms", (time.perf_counter() - files_start) * 1000)
         except Exception as e:
-            print(f"[ERROR] Failed to create server files: {e}")
+            log.error("Failed to create server files: %s", e)
             raise
         
         elapsed_time = time.time() - start_time
@@ -808,24 +1494,125 @@ class SpigotServerCreator:
         
         return server_dir
     
+    def create_servers_batch(self, specs: List[Dict]) -> List[Path]:
+        """Creates several servers, building missing Spigot versions in parallel processes"""
+        import concurrent.futures
+        missing = [
+            version for version in dict.fromkeys(
+                spec["version"] for spec in specs
+                if (spec.get("options") or CreateOptions()).type == "spigot"
+            )
+            if not (self.cache_dir / f"spigot-{version}.jar").exists()
+        ]
+
+        # Version -> Fehlermeldung; Server dieser Versionen werden nicht erneut gebaut
+        failed_versions: Dict[str, str] = {}
+        if len(missing) > 1:
+            # BuildTools ist CPU-lastig (Maven/javac); je Version ein eigener Prozess
+            workers = max(1, min(len(missing), (os.cpu_count() or 2) // 2))
+            print(f"Building Spigot {', '.join(missing)} with {workers} parallel workers...")
+            # Java-Check und BuildTools-Download erst im Worker, wenn kein Prebuilt-JAR verfügbar ist;
+            # ein Java-Fehler landet wie jeder Build-Fehler in failed_versions
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(_build_spigot_worker, os.fspath(self.servers_dir), version): version
+                    for version in missing
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        failed_versions[futures[future]] = str(e)
+                        print(f"Error building Spigot {futures[future]}: {e}")
+
+        # Der Rest ist billig und läuft seriell, die JARs liegen jetzt im Cache;
+        # ein fehlgeschlagener Server bricht die übrigen nicht ab
+        created: List[Path] = []
+        failures: List[str] = []
+        for spec in specs:
+            options = spec.get("options") or CreateOptions()
+            if options.type == "spigot" and spec["version"] in failed_versions:
+                failures.append(f"{spec['name']}: Spigot {spec['version']} build failed "
+                                f"({failed_versions[spec['version']]})")
+                continue
+            try:
+                created.append(self.create_server(spec["name"], spec["version"], spec.get("port", 25565),
+                                                  spec.get("memory", "2G"), options=options))
+            except Exception as e:
+                failures.append(f"{spec['name']}: {e}")
+
+        print(f"\nCreated {len(created)} of {len(specs)} servers.")
+        if failures:
+            raise Exception(f"{len(failures)} server(s) failed:\n  " + "\n  ".join(failures))
+        return created
+
     def create_server_simple(self, name: str, version: str, port: int = 25565, memory: str = "2G") -> Path:
         """Simple server creation without advanced options - for compatibility"""
         return self.create_server(name, version, port, memory)
     
-    def list_servers(self) -> List[Path]:
-        """Lists all available servers"""
-        if not self.servers_dir.exists():
-            return []
-        
+    def _server_paths(self, require_info: bool = True) -> List[str]:
+        """Paths of all server directories as plain strings (no Path objects per entry)"""
         servers = []
-        for item in self.servers_dir.iterdir():
-            if item.is_dir():
-                info_file = item / "server_info.json"
-                if info_file.exists():
-                    servers.append(item)
+        try:
+            with os.scandir(os.fspath(self.servers_dir)) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    if require_info:
+                        try:
+                            os.stat(os.path.join(entry.path, "server_info.json"))
+                        except OSError:
+                            continue
+                    servers.append(entry.path)
+        except FileNotFoundError:
+            return []
         
         return servers
+
+    def list_servers(self) -> List[Path]:
+        """Lists all available servers"""
+        return [Path(p) for p in self._server_paths()]
     
+    def _read_info(self, server_dir) -> Dict:
+        """Reads and parses server_info.json of a server (accepts str or Path)"""
+        return _loads(_read_bytes(os.path.join(server_dir, "server_info.json")))
+
+    def _load_server_index(self) -> Dict[str, Dict[str, List]]:
+        """Loads the server index of this servers directory from the cache ({name: [[mtime_ns, size], info]})"""
+        try:
+            index = _loads(_read_bytes(self.cache_dir / "server_index.json"))
+            return index.get(os.fspath(self.servers_dir.resolve()), {})
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _save_server_index(self, servers: Dict[str, List]) -> None:
+        """Stores the server index of this servers directory, entries of other directories are kept"""
+        index_file = self.cache_dir / "server_index.json"
+        try:
+            index = _loads(_read_bytes(index_file))
+            if not isinstance(index, dict):
+                index = {}
+        except (OSError, ValueError):
+            index = {}
+        index[os.fspath(self.servers_dir.resolve())] = servers
+        try:
+            self._write_bytes_atomic(index_file, _dumps(index, indent=False))
+        except OSError as e:
+            log.debug("Server index not written: %s", e)
+
+    def _read_info_indexed(self, server_dir: str, index: Dict[str, List], new_index: Dict[str, List]) -> Dict:
+        """Like _read_info, but unchanged files (same mtime and size) are taken from the server index"""
+        st = os.stat(os.path.join(server_dir, "server_info.json"))
+        key = [st.st_mtime_ns, st.st_size]
+        name = os.path.basename(server_dir)
+        cached = index.get(name)
+        if isinstance(cached, list) and len(cached) == 2 and cached[0] == key:
+            info = cached[1]
+        else:
+            info = self._read_info(server_dir)
+        new_index[name] = [key, info]
+        return info
+
     def remove_server(self, name: str, force: bool = False) -> bool:
         """Removes a server with optimized deletion"""
         server_dir = self.servers_dir / name
@@ -848,17 +1635,65 @@ class SpigotServerCreator:
             print(f"Error during deletion: {e}")
             return False
 
-    def clean_cache(self) -> None:
+    def get_cache_info(self) -> Tuple[int, int]:
+        """Returns number of files and total size of the cache in one pass"""
+        file_count = 0
+        cache_size = 0
+        if hasattr(os, "fwalk"):
+            # fstatat relativ zum Verzeichnis-fd, der Kernel löst nicht jedes Mal den ganzen Pfad auf
+            os_stat = os.stat
+            is_reg = stat.S_ISREG
+            try:
+                for _, _, filenames, dir_fd in os.fwalk(self.cache_dir):
+                    for name in filenames:
+                        try:
+                            st = os_stat(name, dir_fd=dir_fd, follow_symlinks=False)
+                        except FileNotFoundError:
+                            continue
+                        if is_reg(st.st_mode):
+                            cache_size += st.st_size
+                            file_count += 1
+            except FileNotFoundError:
+                pass
+            return file_count, cache_size
+
+        # Ohne os.fwalk (Windows) mit einem scandir-Stapel
+        stack = [os.fspath(self.cache_dir)]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except FileNotFoundError:
+                continue
+            with it:
+                for entry in it:
+                    # Typ aus dem Verzeichniseintrag (d_type), stat nur für reguläre Dateien;
+                    # der Cache enthält fast nur Dateien, daher wird is_file zuerst geprüft
+                    if entry.is_file(follow_symlinks=False):
+                        cache_size += entry.stat(follow_symlinks=False).st_size
+                        file_count += 1
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        return file_count, cache_size
+
+    def clean_cache(self, force: bool = False) -> None:
         """Cleans the cache with optimized removal"""
-        if not self.cache_dir.exists():
+        # Ein scandir prüft Existenz und Leere zugleich; ein leerer Cache muss nicht gelöscht werden
+        try:
+            with os.scandir(self.cache_dir) as it:
+                is_empty = next(it, None) is None
+        except FileNotFoundError:
             print("Cache directory does not exist.")
             return
-        
-        response = input("Really delete cache? (y/N): ")
-        if response.lower() != 'y':
-            print("Cancelled.")
+        if is_empty:
+            print("Cache is already empty.")
             return
         
+        if not force:
+            response = input("Really delete cache? (y/N): ")
+            if response.lower() != 'y':
+                print("Cancelled.")
+                return
+        
         try:
             self.fast_rmtree(self.cache_dir, show_progress=True)
             self.cache_dir.mkdir(parents=True)
@@ -868,57 +1703,77 @@ class SpigotServerCreator:
     
     def show_config(self) -> None:
         """Displays the current configuration"""
-        print("Current configuration:")
-        print(json.dumps(self.config, indent=2))
-        print(f"\nConfiguration file: {self.config_file}")
+        # Ein einziger write statt drei print-Aufrufen; _dumps serialisiert bereits in C
+        sys.stdout.write(f"Current configuration:\n{_dumps(self.config).decode('utf-8')}\n"
+                         f"\nConfiguration file: {self.config_file}\n")
     
-    def update_config(self, key: str, value: str) -> None:
-        """Updates a configuration value"""
+    def update_config(self, key: str, value: str, flush: bool = True) -> None:
+        """Updates a configuration value; with flush=False it is written later by flush_config"""
         try:
-            parsed_value = json.loads(value)
-        except json.JSONDecodeError:
+            parsed_value = _loads(value)
+        except ValueError:
             parsed_value = value
         
         self.config[key] = parsed_value
-        
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        self._config_dirty = True
+        if flush:
+            self.flush_config()
         
         print(f"Configuration updated: {key} = {parsed_value}")
 
-def main():
-    """Main function with command line interface"""
-    
-    creator = SpigotServerCreator()
-    
-    parser = argparse.ArgumentParser(
-        description="Minecraft Spigot Test Server Creator - Optimized Version",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
- %(prog)s create MyServer 1.21.4 # Create server with default settings
- %(prog)s create TestServer 1.20.4 -p 25566 -m 4G # Server with port 25566 and 4GB RAM
- %(prog)s create DevServer 1.19.4 --gamemode survival --difficulty normal
- %(prog)s list # Show all servers
- %(prog)s remove MyServer # Delete server
- %(prog)s versions # Show available versions
- %(prog)s config show # Show configuration
- %(prog)s config set quick_mode true # Activate Quick-Mode
- """
-    )
-    
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    def flush_config(self) -> None:
+        """Writes pending configuration changes with a single atomic write"""
+        if not self._config_dirty:
+            return
+        # Atomar ersetzen, ein Abbruch mitten im Schreiben zerstört die Konfiguration nicht
+        self._write_bytes_atomic(self.config_file, _dumps(self.config))
+        self._config_dirty = False
+
+
+def _build_spigot_worker(servers_dir: str, version: str) -> str:
+    """Builds one Spigot version in a worker process of create_servers_batch"""
+    # Parallele BuildTools-Ausgaben nicht vermischen, sie landen im Log der Version
+    creator = SpigotServerCreator(servers_dir=Path(servers_dir), quick_mode=True)
+    try:
+        return os.fspath(creator.build_spigot(version))
+    finally:
+        creator.close()
+
+
+def _load_batch_specs(batch_file: str) -> List[Dict]:
+    """Reads a batch file: a JSON list of {name, version, port, memory, <CreateOptions fields>}"""
+    entries = _loads(_read_bytes(batch_file))
+    if not isinstance(entries, list):
+        raise Exception("Batch file must contain a JSON list of servers")
+
+    option_fields = {field.name for field in dataclasses.fields(CreateOptions)}
+    specs = []
+    for entry in entries:
+        spec = {key: entry[key] for key in ("name", "version", "port", "memory") if key in entry}
+        if "name" not in spec or "version" not in spec:
+            raise Exception(f"Batch entry needs 'name' and 'version': {entry}")
+        unknown = set(entry) - option_fields - {"name", "version", "port", "memory"}
+        if unknown:
+            raise Exception(f"Unknown batch keys: {', '.join(sorted(unknown))}")
+        for key, allowed in (("type", _SERVER_TYPES), ("gamemode", _GAMEMODES), ("difficulty", _DIFFICULTIES)):
+            if key in entry and entry[key] not in allowed:
+                raise Exception(f"Invalid {key} '{entry[key]}' for {spec['name']} (choose from {', '.join(allowed)})")
+        spec["options"] = CreateOptions(**{key: entry[key] for key in option_fields if key in entry})
+        specs.append(spec)
+    return specs
 
+
+def _build_create(subparsers) -> None:
     create_parser = subparsers.add_parser('create', help='Creates a new server')
     create_parser.add_argument('name', help='Name of the server')
     create_parser.add_argument('version', help='Minecraft version (e.g. 1.21.4)')
-    create_parser.add_argument('--type', choices=['spigot', 'bukkit', 'vanilla'], default='spigot', help='Server type (default: spigot)')
+    create_parser.add_argument('--type', choices=_SERVER_TYPES, default='spigot', help='Server type (default: spigot)')
     create_parser.add_argument('-p', '--port', type=int, default=25565, help='Server port (default: 25565)')
     create_parser.add_argument('-m', '--memory', default='2G', help='RAM allocation (default: 2G)')
     create_parser.add_argument('--dir', '--directory', dest='directory', default=None, help='Directory to save the server')
-    create_parser.add_argument('--gamemode', choices=['survival', 'creative', 'adventure', 'spectator'], 
+    create_parser.add_argument('--gamemode', choices=_GAMEMODES,
         default='creative', help='Gamemode (default: creative)')
-    create_parser.add_argument('--difficulty', choices=['peaceful', 'easy', 'normal', 'hard'], 
+    create_parser.add_argument('--difficulty', choices=_DIFFICULTIES,
         default='peaceful', help='Difficulty (default: peaceful)')
     create_parser.add_argument('--max-players', type=int, default=10, help='Max players (default: 10)')
     create_parser.add_argument('--online-mode', action='store_true', help='Activate online mode')
@@ -927,106 +1782,175 @@ Examples:
     create_parser.add_argument('--motd', default='Spigot Test Server', help='Server MOTD')
     create_parser.add_argument('--force-rebuild', action='store_true', help='Create new Spigot JAR')
     create_parser.add_argument('--view-distance', type=int, default=10, help='View distance (default: 10)')
-    
+
+
+def _build_batch(subparsers) -> None:
+    batch_parser = subparsers.add_parser('batch', help='Create several servers from a JSON file')
+    batch_parser.add_argument('file', help='JSON list of servers (name, version, port, memory, ...)')
+    batch_parser.add_argument('--dir', '--directory', dest='directory', default=None, help='Directory to save the servers')
+
+
+def _build_list(subparsers) -> None:
     subparsers.add_parser('list', help='List all servers')
 
-    # Remove Command
+
+def _build_remove(subparsers) -> None:
     remove_parser = subparsers.add_parser('remove', help='Remove a server')
     remove_parser.add_argument('name', help='Name of the server to delete')
+    remove_parser.add_argument('-y', '--yes', action='store_true', help='Delete without confirmation')
 
-    # Versions Command
+
+def _build_versions(subparsers) -> None:
     subparsers.add_parser('versions', help='Show available versions')
 
-    # Cache Command
+
+def _build_cache(subparsers) -> None:
     cache_parser = subparsers.add_parser('cache', help='Cache management')
     cache_subparsers = cache_parser.add_subparsers(dest='cache_action')
-    cache_subparsers.add_parser('clean', help='Clean cache')
+    cache_clean_parser = cache_subparsers.add_parser('clean', help='Clean cache')
+    cache_clean_parser.add_argument('-y', '--yes', action='store_true', help='Clean without confirmation')
     cache_subparsers.add_parser('info', help='Cache information')
 
-    # Config Command
+
+def _build_config(subparsers) -> None:
     config_parser = subparsers.add_parser('config', help='Manage configuration')
     config_subparsers = config_parser.add_subparsers(dest='config_action')
+    config_subparsers.add_parser('show', help='Show configuration')
     config_set_parser = config_subparsers.add_parser('set', help='Set configuration value')
     config_set_parser.add_argument('key', help='Configuration key')
     config_set_parser.add_argument('value', help='New value')
+
+
+# Befehl -> Aufbau seines Subparsers (Reihenfolge = Reihenfolge in --help)
+_SUBPARSER_BUILDERS = {
+    'create': _build_create,
+    'batch': _build_batch,
+    'list': _build_list,
+    'remove': _build_remove,
+    'versions': _build_versions,
+    'cache': _build_cache,
+    'config': _build_config,
+}
+
+
+def main():
+    """Main function with command line interface"""
+    import argparse
     
-    args = parser.parse_args()
+    parser = argparse.ArgumentParser(
+        description="Minecraft Spigot Test Server Creator - Optimized Version",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+ %(prog)s create MyServer 1.21.4 # Create server with default settings
+ %(prog)s create TestServer 1.20.4 -p 25566 -m 4G # Server with port 25566 and 4GB RAM
+ %(prog)s create DevServer 1.19.4 --gamemode survival --difficulty normal
+ %(prog)s batch servers.json # Create several servers, building versions in parallel
+ %(prog)s list # Show all servers
+ %(prog)s remove MyServer # Delete server
+ %(prog)s versions # Show available versions
+ %(prog)s config show # Show configuration
+ %(prog)s config set quick_mode true # Activate Quick-Mode
+ """
+    )
+    
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
 
-    servers_dir = Path(args.directory) if getattr(args, 'directory', None) else None
-    creator = SpigotServerCreator(servers_dir=servers_dir)
+    # Nur den Subparser des aufgerufenen Befehls aufbauen; ohne bekannten Befehl
+    # (z.B. --help oder Tippfehler) wird der komplette Baum erstellt
+    cmd = sys.argv[1] if len(sys.argv) > 1 else None
+    if cmd in _SUBPARSER_BUILDERS:
+        _SUBPARSER_BUILDERS[cmd](subparsers)
+    else:
+        for build in _SUBPARSER_BUILDERS.values():
+            build(subparsers)
     
+    args = parser.parse_args()
+
     if not args.command:
         parser.print_help()
         return
+
+    servers_dir = Path(args.directory) if getattr(args, 'directory', None) else None
+    creator = SpigotServerCreator(servers_dir=servers_dir)
     
     try:
         if args.command == 'create':
-            # Java check only if not skipped
-            if not creator.check_java_version():
-                sys.exit(1)
-            
-            # Collect all options
-            options = {
-                'gamemode': args.gamemode,
-                'difficulty': args.difficulty,
-                'max_players': args.max_players,
-                'online_mode': args.online_mode,
-                'pvp': args.pvp,
-                'whitelist': args.whitelist,
-                'motd': args.motd,
-                'force_rebuild': args.force_rebuild,
-                'view_distance': args.view_distance,
-                'type': args.type
-            }
+            # Kein Java-Check vorab: Java braucht nur BuildTools, dort wird es geprüft
+            options = CreateOptions(
+                type=args.type,
+                gamemode=args.gamemode,
+                difficulty=args.difficulty,
+                max_players=args.max_players,
+                online_mode=args.online_mode,
+                pvp=args.pvp,
+                whitelist=args.whitelist,
+                motd=args.motd,
+                view_distance=args.view_distance,
+                force_rebuild=args.force_rebuild
+            )
             
-            creator.create_server(args.name, args.version, args.port, args.memory, **options)
+            creator.create_server(args.name, args.version, args.port, args.memory, options=options)
+
+        elif args.command == 'batch':
+            creator.create_servers_batch(_load_batch_specs(args.file))
         
         elif args.command == 'list':
-            servers = creator.list_servers()
-            if not servers:
+            import concurrent.futures
+
+            # Kein extra stat pro Verzeichnis: fehlt server_info.json beim Lesen, ist es kein Server
+            candidates = creator._server_paths(require_info=False)
+            # Unveränderte server_info.json kommen aus dem Index im Cache (nur ein stat statt open/read)
+            index = creator._load_server_index()
+            new_index: Dict[str, List] = {}
+            # Info-Dateien parallel lesen, Ausgabe in der ursprünglichen Reihenfolge;
+            # nicht mehr Threads als Server (Threads entstehen erst bei submit)
+            workers = max(1, min(32, len(candidates)))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(creator._read_info_indexed, server_dir, index, new_index)
+                           for server_dir in candidates]
+            rows = []
+            for server_dir, future in zip(candidates, futures):
+                name = os.path.basename(server_dir)
+                try:
+                    info_get = future.result().get
+                    version, port, memory = (info_get('version', 'unknown'), info_get('port', 'unknown'),
+                                             info_get('memory', 'unknown'))
+                except FileNotFoundError:
+                    continue
+                except (OSError, ValueError, AttributeError):
+                    # Nicht lesbar, kein gültiges JSON oder kein JSON-Objekt
+                    rows.append(f"  {name}: (Info not readable)")
+                    continue
+                rows.append(f"  {name}: Version {version}, Port {port}, Memory {memory}")
+            if new_index != index:
+                creator._save_server_index(new_index)
+            if not rows:
                 print("No servers found.")
             else:
-                print(f"Found servers ({len(servers)}):")
-                for server_dir in servers:
-                    info_file = server_dir / "server_info.json"
-                    if info_file.exists():
-                        try:
-                            with open(info_file, 'r') as f:
-                                info = json.load(f)
-                            print(f"  {server_dir.name}: Version {info.get('version', 'unknown')}, "
-                                  f"Port {info.get('port', 'unknown')}, "
-                                  f"Memory {info.get('memory', 'unknown')}")
-                        except:  # noqa: E722
-                            print(f"  {server_dir.name}: (Info not readable)")
-                    else:
-                        print(f"  {server_dir.name}: (No info available)")
+                # Kopfzeile und alle Zeilen in einem write
+                sys.stdout.write(f"Found servers ({len(rows)}):\n" + "\n".join(rows) + "\n")
         
         elif args.command == 'remove':
-            creator.remove_server(args.name)
+            creator.remove_server(args.name, force=args.yes)
         
         elif args.command == 'versions':
             versions = creator.get_available_versions()
-            print("Available Minecraft versions:")
-            for i, version in enumerate(versions, 1):
-                print(f"  {version}", end="\n" if i % 5 == 0 else " ")
-            if len(versions) % 5 != 0:
-                print()
+            # Fünf Versionen pro Zeile in Spalten fester Breite (einmal berechnet), alles in einem write
+            width = max(map(len, versions), default=0) + 3
+            rows = "\n".join(("  " + "".join(v.ljust(width) for v in versions[i:i + 5])).rstrip()
+                             for i in range(0, len(versions), 5))
+            sys.stdout.write(f"Available Minecraft versions:\n{rows}\n")
         
         elif args.command == 'cache':
             if args.cache_action == 'clean':
-                creator.clean_cache()
+                creator.clean_cache(force=args.yes)
             elif args.cache_action == 'info':
-                cache_size = 0
-                file_count = 0
-                if creator.cache_dir.exists():
-                    for file_path in creator.cache_dir.rglob('*'):
-                        if file_path.is_file():
-                            cache_size += file_path.stat().st_size
-                            file_count += 1
+                file_count, cache_size = creator.get_cache_info()
                 
-                print(f"Cache directory: {creator.cache_dir}")
-                print(f"Files: {file_count}")
-                print(f"Size: {cache_size / 1024 / 1024:.2f} MB")
+                sys.stdout.write(f"Cache directory: {creator.cache_dir}\n"
+                                 f"Files: {file_count}\n"
+                                 f"Size: {cache_size / 1024 / 1024:.2f} MB\n")
             else:
                 print("Cache action required: clean, info")
         
@@ -1044,6 +1968,8 @@ Examples:
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        creator.close()
 
 
 if __name__ == "__main__":